@@ -1,9 +1,15 @@
 import sys
 import os
+from contextlib import ExitStack
 
 from src.use_cases.store_file import StoreFile
 from src.use_cases.load_file import LoadFile
 from src.use_cases.destroy_file import DestroyFile
+from src.use_cases.export_files import ExportFiles
+from src.use_cases.import_files import ImportFiles
+from src.use_cases.create_snapshot import CreateSnapshot
+from src.use_cases.backup_files import BackupFiles
+from src.use_cases.restore_files import RestoreFiles
 from src.configs.injection_config import InjectionConfig
 
 INVALID_NUM_ARGUMENTS = 1
@@ -13,7 +19,9 @@ INVALID_ARGUMENTS = 2
 def main(argv: list):
     """
     Based on the provided options and parameters instantiate the
-    needed use case and store/load or destroy a file/s.
+    needed use case and store/sync/load or destroy a file/s,
+    export/import the whole storage or snapshot, back up
+    and restore it.
 
     :param argv: Command line arguments
     """
@@ -23,7 +31,7 @@ def main(argv: list):
     if len(argv) < 2:
         exit(INVALID_NUM_ARGUMENTS)
 
-    valid_options = ['-s', '-sm', '-l', '-lm', '-d', '-dm']
+    valid_options = ['-s', '-sm', '-sy', '-l', '-lm', '-d', '-dm', '-e', '-i', '-sn', '-b', '-r']
     option = argv[1]
 
     if option not in valid_options:
@@ -43,23 +51,19 @@ def main(argv: list):
     elif option == '-sm':
         # noinspection PyBroadException
         try:
-            files = []
-            for i in range(2, len(argv)):
-                file_path = argv[i]
-
-                if os.path.isdir(file_path):
-                    files.extend(list_files(file_path))
-                else:
-                    files.append({
-                        'path': file_path,
-                        'id': os.path.basename(file_path)
-                    })
+            files = collect_files(argv[2:])
 
             store_file = StoreFile(injection_config.get_file_service())
             store_file.store_files(files)
         except IndexError:
             exit(INVALID_NUM_ARGUMENTS)
 
+    elif option == '-sy':
+        files = collect_files(argv[2:])
+
+        store_file = StoreFile(injection_config.get_file_service())
+        store_file.sync_files(files)
+
     elif option == '-l':
         # noinspection PyBroadException
         try:
@@ -104,28 +108,109 @@ def main(argv: list):
         except IndexError:
             exit(INVALID_NUM_ARGUMENTS)
 
+    elif option == '-e':
+        export_files = ExportFiles(injection_config.get_file_service())
+
+        if len(argv) > 2:
+            with open(argv[2], 'wb') as archive:
+                export_files.export_files(archive)
+        else:
+            export_files.export_files(sys.stdout.buffer)
+
+    elif option == '-i':
+        import_files = ImportFiles(injection_config.get_file_service())
+
+        if len(argv) > 2:
+            with open(argv[2], 'rb') as archive:
+                import_files.import_files(archive)
+        else:
+            import_files.import_files(sys.stdin.buffer)
+
+    elif option == '-sn':
+        # noinspection PyBroadException
+        try:
+            snapshot_name = argv[2]
+
+            create_snapshot = CreateSnapshot(injection_config.get_file_service())
+            create_snapshot.create_snapshot(snapshot_name)
+        except IndexError:
+            exit(INVALID_NUM_ARGUMENTS)
+
+    elif option == '-b':
+        # noinspection PyBroadException
+        try:
+            snapshot_name = argv[2]
+
+            backup_files = BackupFiles(injection_config.get_file_service())
+
+            if len(argv) > 3:
+                with open(argv[3], 'wb') as archive:
+                    backup_files.backup_files(archive, snapshot_name)
+            else:
+                backup_files.backup_files(sys.stdout.buffer, snapshot_name)
+        except IndexError:
+            exit(INVALID_NUM_ARGUMENTS)
+
+    elif option == '-r':
+        restore_files = RestoreFiles(injection_config.get_file_service())
+
+        if len(argv) > 2:
+            with ExitStack() as stack:
+                archives = [stack.enter_context(open(argv[i], 'rb')) for i in range(2, len(argv))]
+                restore_files.restore_files(archives)
+        else:
+            restore_files.restore_files([sys.stdin.buffer])
+
+
+def collect_files(paths: list):
+    """
+    Return a list of files from the provided paths where every directory is
+    replaced by the files inside of it recursively.
+
+    :param paths: List of file and directory paths
+    :return: List of files
+    """
+
+    files = []
+
+    for file_path in paths:
+        if os.path.isdir(file_path):
+            files.extend(list_files(file_path))
+        else:
+            files.append({
+                'path': file_path,
+                'id': os.path.basename(file_path)
+            })
+
+    return files
+
 
 def list_files(path: str):
     """
     Return a list of files in the initial directory and all the other directories
     inside of it recursively.
 
+    The size and mtime of every file are taken from the directory walk so the
+    files can be compared against the id storage without being opened.
+
     :param path: Initial directory path
     :return: List of files
     """
 
     file_list = []
-    files = os.listdir(path)
 
-    for file in files:
-        abs_file = os.path.join(path, file)
-        if os.path.isdir(abs_file):
-            file_list.extend(list_files(abs_file))
-        else:
-            file_list.append({
-                'path': abs_file,
-                'id': file
-            })
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                file_list.extend(list_files(entry.path))
+            else:
+                file_stat = entry.stat()
+                file_list.append({
+                    'path': entry.path,
+                    'id': entry.name,
+                    'size': file_stat.st_size,
+                    'mtime': file_stat.st_mtime_ns
+                })
 
     return file_list
 
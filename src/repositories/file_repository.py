@@ -1,6 +1,40 @@
 import os
 import json
+import hashlib
+import tarfile
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+
+BUFFER_SIZE = 65536
+NAME_HEADER = 'PYBIN.name'
+ACTION_HEADER = 'PYBIN.action'
+SINCE_HEADER = 'PYBIN.since'
+UNTIL_HEADER = 'PYBIN.until'
+POSITION_HEADER = 'PYBIN.position'
+DESTROY_ACTION = 'destroy'
+BACKUP_MEMBER = '.pybin'
+MANIFEST_KEYS = ('mtime', 'fingerprint')
+FINGERPRINT_SIZE = 32
+POOL_MIN_FILES = 16
+
+
+def fingerprint_file(file_path: str) -> str:
+    """
+    Return the fingerprint of a file by hashing its content using
+    a fixed size buffer.
+
+    :param file_path: File path
+    :return: Hex digest of the file content
+    """
+
+    file_hash = hashlib.blake2b(digest_size=FINGERPRINT_SIZE)
+
+    with open(file_path, 'rb') as r_file:
+        for file_bytes in iter(lambda: r_file.read(BUFFER_SIZE), b''):
+            file_hash.update(file_bytes)
+
+    return file_hash.hexdigest()
 
 
 class IFileRepository(ABC):
@@ -17,6 +51,14 @@ class IFileRepository(ABC):
     def store_file(self, file_path: str, file_id: str):
         pass
 
+    @abstractmethod
+    def store_files(self, files: list):
+        pass
+
+    @abstractmethod
+    def sync_files(self, files: list):
+        pass
+
     @abstractmethod
     def load_file(self, file_id: str):
         pass
@@ -25,6 +67,26 @@ class IFileRepository(ABC):
     def destroy_file(self, file_id: str):
         pass
 
+    @abstractmethod
+    def export_files(self, archive):
+        pass
+
+    @abstractmethod
+    def import_files(self, archive):
+        pass
+
+    @abstractmethod
+    def create_snapshot(self, snapshot_name: str):
+        pass
+
+    @abstractmethod
+    def backup_files(self, archive, snapshot_name: str):
+        pass
+
+    @abstractmethod
+    def restore_files(self, archives: list):
+        pass
+
 
 class FileRepository(IFileRepository):
     """
@@ -46,12 +108,14 @@ class FileRepository(IFileRepository):
 
         self.storage_path = f'{storage_dir_path}.bin'
         self.id_storage_path = f'{storage_dir_path}.json'
+        self.snapshot_storage_path = f'{storage_dir_path}.snapshots.json'
         self.output_dir_path = output_dir_path
 
     def store_file(self, file_path: str, file_id: str):
         """
         Store the file by appending the file bytes to the end of the storage file
-        and update the id storage with the position, size, name and extension of the new file.
+        and update the id storage with the position, size, name and extension of the new file
+        along with the generation it was stored in.
 
         :param file_path: File path
         :param file_id: File identity
@@ -70,9 +134,7 @@ class FileRepository(IFileRepository):
 
                 file_position = w_file.tell()
                 self.__store_id(file_id, file_position, file_size, file_name, file_extension)
-
-                for file_bytes in r_file:
-                    w_file.write(file_bytes)
+                self.__copy_bytes(r_file, w_file, file_size)
 
     def __store_id(self, file_id: str, file_position: int, file_size: int, file_name: str, file_extension: str):
         """
@@ -91,6 +153,8 @@ class FileRepository(IFileRepository):
         :param file_extension: File extension
         """
 
+        generation = self.__load_snapshots()['generation']
+
         with open(self.id_storage_path, 'r') as r_file:
             content = r_file.read()
 
@@ -107,11 +171,327 @@ class FileRepository(IFileRepository):
                 'size': file_size,
                 'name': file_name,
                 'extension': file_extension,
+                'generation': generation,
             }
 
         with open(self.id_storage_path, 'w') as w_file:
             w_file.write(json.dumps(ids))
 
+    def store_files(self, files: list):
+        """
+        Store multiple files using a single pass over the storage file and
+        the id storage instead of reopening both of them for every file.
+
+        :param files: List of dicts containing a file path and a file id
+        """
+
+        self.__append_files(self.__open_files(files))
+
+    @staticmethod
+    def __open_files(files: list):
+        """
+        Lazily open the provided files one at a time and yield the records
+        expected by the append method.
+
+        :param files: List of dicts containing a file path and a file id
+        :return: Generator of file records
+        """
+
+        for file in files:
+            file_path = file['path']
+
+            if not os.path.exists(file_path):
+                raise FileNotFoundException(file_path)
+
+            with open(file_path, 'rb') as r_file:
+                record = {
+                    'id': file['id'],
+                    'name': os.path.basename(file_path),
+                    'size': os.path.getsize(file_path),
+                    'stream': r_file,
+                }
+
+                for key in MANIFEST_KEYS:
+                    if key in file:
+                        record[key] = file[key]
+
+                yield record
+
+    def __append_files(self, files, replace: bool = False, fingerprint: bool = False):
+        """
+        Append every file record to the end of the storage file while holding
+        both the storage file and the loaded id storage open, and save the
+        id storage once at the end.
+
+        Each record is a dict containing the id, name, size and a readable
+        stream of the file and optionally its mtime and fingerprint. Records
+        marked as destroyed only contain the id and destroy the stored file
+        if it exists. A replaced file is only destroyed once its new copy has
+        been written so a failed copy leaves the stored file untouched. The
+        ids stored before an error are still saved so the storage and the id
+        storage never go out of sync.
+
+        :param files: Iterable of file records
+        :param replace: Replace files with an existing id instead of raising
+        :param fingerprint: Fingerprint the records without one while copying
+        """
+
+        ids = self.__load_ids()
+        snapshots = self.__load_snapshots()
+        generation = snapshots['generation']
+
+        try:
+            with open(self.storage_path, 'r+b') as w_file:
+                w_file.seek(0, os.SEEK_END)
+                end_position = w_file.tell()
+
+                for file in files:
+                    file_id = file['id']
+
+                    if file.get('destroyed', False):
+                        if file_id in ids:
+                            self.__zero_bytes(w_file, ids.pop(file_id))
+                            snapshots['destroyed'][file_id] = generation
+
+                        continue
+
+                    old_file_stats = ids.get(file_id)
+
+                    if old_file_stats is not None and not replace:
+                        raise IdentityAlreadyExistsException(file_id)
+
+                    file_name = file['name']
+                    file_hash = None
+
+                    if fingerprint and 'fingerprint' not in file:
+                        file_hash = hashlib.blake2b(digest_size=FINGERPRINT_SIZE)
+
+                    w_file.seek(end_position, os.SEEK_SET)
+                    self.__copy_bytes(file['stream'], w_file, file['size'], file_hash)
+
+                    file_stats = {
+                        'position': end_position,
+                        'size': w_file.tell() - end_position,
+                        'name': file_name,
+                        'extension': os.path.splitext(file_name)[1],
+                        'generation': generation,
+                    }
+                    end_position = w_file.tell()
+
+                    for key in MANIFEST_KEYS:
+                        if key in file:
+                            file_stats[key] = file[key]
+
+                    if file_hash is not None:
+                        file_stats['fingerprint'] = file_hash.hexdigest()
+
+                    if old_file_stats is not None:
+                        self.__zero_bytes(w_file, old_file_stats)
+
+                    ids[file_id] = file_stats
+        finally:
+            self.__save_ids(ids)
+            self.__save_snapshots(snapshots)
+
+    def sync_files(self, files: list):
+        """
+        Store multiple files skipping the ones that did not change since they
+        were last stored and replacing the ones that did.
+
+        Every file has to have a unique id. A file is skipped without being
+        opened when its size and mtime match the ones in the id storage. The
+        remaining files whose stored copy has the same size and a fingerprint
+        are fingerprinted in parallel and the ones with a matching fingerprint
+        only get their mtime updated. The rest are replaced using the append
+        method which fingerprints them while copying so they are read once.
+
+        :param files: List of dicts containing a file path, a file id and
+            optionally the size and mtime from the directory walk
+        """
+
+        ids = self.__load_ids()
+        file_ids = set()
+        changed = []
+
+        for file in files:
+            if file['id'] in file_ids:
+                raise IdentityAlreadyExistsException(file['id'])
+
+            file_ids.add(file['id'])
+
+        for file in files:
+            file_path = file['path']
+            file_size = file.get('size')
+            file_mtime = file.get('mtime')
+
+            if file_size is None or file_mtime is None:
+                if not os.path.exists(file_path):
+                    raise FileNotFoundException(file_path)
+
+                file_stat = os.stat(file_path)
+                file_size = file_stat.st_size
+                file_mtime = file_stat.st_mtime_ns
+
+            file_stats = ids.get(file['id'])
+
+            if file_stats is not None and file_stats['size'] == file_size and file_stats.get('mtime') == file_mtime:
+                continue
+
+            changed.append({
+                'path': file_path,
+                'id': file['id'],
+                'size': file_size,
+                'mtime': file_mtime,
+            })
+
+        if len(changed) == 0:
+            return
+
+        candidates = [
+            file
+            for file in changed
+            if file['id'] in ids and ids[file['id']]['size'] == file['size'] and 'fingerprint' in ids[file['id']]
+        ]
+        fingerprints = self.__fingerprint_files([file['path'] for file in candidates])
+        unchanged = set()
+
+        for file, fingerprint in zip(candidates, fingerprints):
+            file_stats = ids[file['id']]
+
+            if file_stats['fingerprint'] == fingerprint:
+                file_stats['mtime'] = file['mtime']
+                unchanged.add(file['id'])
+            else:
+                file['fingerprint'] = fingerprint
+
+        replaced = [file for file in changed if file['id'] not in unchanged]
+
+        self.__save_ids(ids)
+        self.__append_files(self.__open_files(replaced), replace=True, fingerprint=True)
+
+    @staticmethod
+    def __fingerprint_files(file_paths: list):
+        """
+        Fingerprint the provided files across a pool of processes, or in the
+        current process when there are too few of them to pay for the pool.
+
+        :param file_paths: List of file paths
+        :return: List of fingerprints in the same order as the file paths
+        """
+
+        if len(file_paths) < POOL_MIN_FILES:
+            return [fingerprint_file(file_path) for file_path in file_paths]
+
+        workers = min(os.cpu_count() or 1, len(file_paths))
+        chunk_size = max(1, len(file_paths) // (workers * 4))
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(fingerprint_file, file_paths, chunksize=chunk_size))
+
+    @staticmethod
+    def __copy_bytes(r_file, w_file, file_size: int, file_hash=None):
+        """
+        Copy at most file_size bytes from one stream to the other using
+        a fixed size buffer, updating the hash with the copied bytes if
+        one is provided.
+
+        :param r_file: Readable stream
+        :param w_file: Writable stream
+        :param file_size: Number of bytes to copy
+        :param file_hash: Optional hash object
+        """
+
+        while file_size > 0:
+            file_bytes = r_file.read(min(BUFFER_SIZE, file_size))
+
+            if len(file_bytes) == 0:
+                break
+
+            w_file.write(file_bytes)
+            file_size -= len(file_bytes)
+
+            if file_hash is not None:
+                file_hash.update(file_bytes)
+
+    @staticmethod
+    def __zero_bytes(w_file, file_stats: dict):
+        """
+        Replace the stored bytes of a file with null bytes.
+
+        :param w_file: Writable storage stream
+        :param file_stats: Stats of the stored file
+        """
+
+        w_file.seek(file_stats['position'], os.SEEK_SET)
+        file_size = file_stats['size']
+
+        while file_size > 0:
+            buffer_size = min(BUFFER_SIZE, file_size)
+            w_file.write(bytearray(buffer_size))
+            file_size -= buffer_size
+
+    def __load_ids(self):
+        """
+        Load the whole id storage.
+
+        :return: Dict of file ids and their stats
+        """
+
+        with open(self.id_storage_path, 'r') as r_file:
+            content = r_file.read()
+
+            if len(content) == 0:
+                return {}
+
+            return json.loads(content)
+
+    def __save_ids(self, ids: dict):
+        """
+        Replace the id storage with the provided ids.
+
+        :param ids: Dict of file ids and their stats
+        """
+
+        with open(self.id_storage_path, 'w') as w_file:
+            w_file.write(json.dumps(ids))
+
+    def __load_snapshots(self):
+        """
+        Load the snapshot storage containing the current generation, the
+        taken snapshots, the generation in which each id was last destroyed
+        and the archives restored into the storage.
+
+        :return: Dict of the snapshot storage
+        """
+
+        snapshots = {
+            'generation': 0,
+            'snapshots': {},
+            'destroyed': {},
+            'restored': [],
+        }
+
+        if not os.path.exists(self.snapshot_storage_path):
+            return snapshots
+
+        with open(self.snapshot_storage_path, 'r') as r_file:
+            content = r_file.read()
+
+            if len(content) != 0:
+                snapshots.update(json.loads(content))
+
+        return snapshots
+
+    def __save_snapshots(self, snapshots: dict):
+        """
+        Replace the snapshot storage with the provided one.
+
+        :param snapshots: Dict of the snapshot storage
+        """
+
+        with open(self.snapshot_storage_path, 'w') as w_file:
+            w_file.write(json.dumps(snapshots))
+
     def load_file(self, file_id: str):
         """
         Load the file from the storage using the provided file_id and save
@@ -131,17 +511,8 @@ class FileRepository(IFileRepository):
         with open(self.storage_path, 'r+b') as r_file:
             r_file.seek(file_position, os.SEEK_SET)
 
-            buffer_size = 65536
-            file_size = file_stats['size']
-
             with open(file_path, 'wb') as w_file:
-                while file_size != 0:
-                    if buffer_size > file_size:
-                        w_file.write(r_file.read(file_size))
-                        file_size -= file_size
-                    else:
-                        w_file.write(r_file.read(buffer_size))
-                        file_size -= buffer_size
+                self.__copy_bytes(r_file, w_file, file_stats['size'])
 
     def __load_id(self, file_id: str):
         """
@@ -168,28 +539,21 @@ class FileRepository(IFileRepository):
     def destroy_file(self, file_id: str):
         """
         Destroy the file from the storage by replacing all of its bytes to null bytes and
-        finalize the process by deleting its id from the id storage.
+        finalize the process by deleting its id from the id storage and recording
+        the generation it was destroyed in.
 
         :param file_id: File identity
         """
 
         file_stats = self.__load_id(file_id)
-        file_position = file_stats['position']
-        file_size = file_stats['size']
-        buffer_size = 65536
 
         with open(self.storage_path, 'r+b') as w_file:
-            w_file.seek(file_position, os.SEEK_SET)
-
-            while file_size != 0:
-                if buffer_size > file_size:
-                    w_file.write(bytearray(file_size))
-                    file_size -= file_size
-                else:
-                    w_file.write(bytearray(buffer_size))
-                    file_size -= buffer_size
+            self.__zero_bytes(w_file, file_stats)
 
-        self.__destroy_id(file_id)
+        if self.__destroy_id(file_id):
+            snapshots = self.__load_snapshots()
+            snapshots['destroyed'][file_id] = snapshots['generation']
+            self.__save_snapshots(snapshots)
 
     def __destroy_id(self, file_id: str):
         """
@@ -215,6 +579,290 @@ class FileRepository(IFileRepository):
 
         return True
 
+    def export_files(self, archive):
+        """
+        Stream every stored file into a tar archive written to the provided
+        binary stream.
+
+        The files are read in the order of their storage position so the
+        storage file is only read forward and destroyed regions are never
+        copied. Apart from the loaded id storage, memory use does not grow
+        with the number of files since the archive headers are dropped as
+        soon as they are written and the bytes are copied using a buffer.
+
+        :param archive: Writable binary stream
+        """
+
+        snapshots = self.__load_snapshots()
+        backup_headers = {}
+
+        if len(snapshots['snapshots']) != 0:
+            backup_headers[UNTIL_HEADER] = self.__last_snapshot(snapshots)
+
+        self.__write_archive(archive, self.__load_ids(), [], backup_headers)
+
+    def import_files(self, archive):
+        """
+        Read a tar archive from the provided binary stream and append every
+        file inside of it to the storage using the member names as ids.
+
+        :param archive: Readable binary stream
+        """
+
+        self.__import_archives([archive], False)
+
+    def restore_files(self, archives: list):
+        """
+        Restore the provided tar archives in order, starting either from an
+        export or from the backup following the last restored archive.
+
+        The order of every archive is checked before any of them is restored.
+        Destroy members written by a backup destroy the stored file with the
+        same id. Files with an existing id are replaced since the same change
+        can be part of consecutive backups.
+
+        :param archives: List of readable binary streams
+        """
+
+        self.__import_archives(archives, True)
+
+    def __import_archives(self, archives: list, replace: bool):
+        """
+        Open every tar archive and read its backup member, check that the
+        archives follow the last restored archive and each other, and only
+        then append their files in order.
+
+        An archive without a base snapshot is an export and starts a new chain
+        of restored archives while a backup has to be based on the snapshot
+        the previous archive was taken up to.
+
+        :param archives: List of readable binary streams
+        :param replace: Replace files with an existing id instead of raising
+        """
+
+        with ExitStack() as stack:
+            backups = [
+                self.__read_backup(stack.enter_context(tarfile.open(fileobj=archive, mode='r|*')))
+                for archive in archives
+            ]
+
+            self.__check_backups(backups)
+
+            for backup in backups:
+                self.__append_files(self.__read_archive(backup['tar'], backup['member']), replace)
+                self.__record_backup(backup)
+
+    @staticmethod
+    def __read_backup(tar: tarfile.TarFile):
+        """
+        Read the first member of the archive and the base and last snapshot
+        from its headers if it is the backup member.
+
+        :param tar: Tar archive opened in stream mode
+        :return: Dict of the archive, its first member and its snapshots
+        """
+
+        tar_info = tar.next()
+        backup_headers = {}
+
+        if tar_info is not None and tar_info.name == BACKUP_MEMBER:
+            backup_headers = tar_info.pax_headers
+
+        return {
+            'tar': tar,
+            'member': tar_info,
+            'since': backup_headers.get(SINCE_HEADER),
+            'until': backup_headers.get(UNTIL_HEADER),
+        }
+
+    def __check_backups(self, backups: list):
+        """
+        Check that every backup is based on the snapshot the previous archive
+        or the last restored archive was taken up to.
+
+        :param backups: List of backup dicts
+        """
+
+        restored = self.__load_snapshots()['restored']
+        based = len(restored) != 0
+        until = restored[-1]['until'] if based else None
+
+        for backup in backups:
+            if backup['since'] is not None and (not based or backup['since'] != until):
+                raise BackupOutOfOrderException(backup['since'])
+
+            based = True
+            until = backup['until']
+
+    def __record_backup(self, backup: dict):
+        """
+        Record the restored archive in the snapshot storage, starting a new
+        chain of restored archives if it is an export.
+
+        :param backup: Backup dict
+        """
+
+        snapshots = self.__load_snapshots()
+
+        if backup['since'] is None:
+            snapshots['restored'] = []
+
+        snapshots['restored'].append({
+            'since': backup['since'],
+            'until': backup['until'],
+        })
+
+        self.__save_snapshots(snapshots)
+
+    def create_snapshot(self, snapshot_name: str):
+        """
+        Take a snapshot of the storage by recording the current generation and
+        the current end of the storage file under the provided name, and move
+        on to the next generation.
+
+        :param snapshot_name: Snapshot name
+        """
+
+        snapshots = self.__load_snapshots()
+
+        if snapshot_name in snapshots['snapshots']:
+            raise SnapshotAlreadyExistsException(snapshot_name)
+
+        snapshots['snapshots'][snapshot_name] = {
+            'generation': snapshots['generation'],
+            'position': os.path.getsize(self.storage_path),
+        }
+        snapshots['generation'] += 1
+
+        self.__save_snapshots(snapshots)
+
+    def backup_files(self, archive, snapshot_name: str):
+        """
+        Stream the changes made since the provided snapshot into a tar archive
+        written to the provided binary stream.
+
+        Only the files stored after the snapshot are read and since they are
+        appended to the storage they all sit past the recorded end position.
+        The archive records the snapshot it is based on and the last snapshot
+        taken so restoring can check the order of the backups. The ids
+        destroyed after the snapshot are written first as empty destroy
+        members so restoring the archive applies them before the files
+        stored again under the same id.
+
+        :param archive: Writable binary stream
+        :param snapshot_name: Snapshot name
+        """
+
+        snapshots = self.__load_snapshots()
+
+        if snapshot_name not in snapshots['snapshots']:
+            raise SnapshotNotFoundException(snapshot_name)
+
+        snapshot = snapshots['snapshots'][snapshot_name]
+        generation = snapshot['generation']
+
+        ids = {
+            file_id: file_stats
+            for file_id, file_stats in self.__load_ids().items()
+            if file_stats.get('generation', 0) > generation
+        }
+        destroyed = [
+            file_id
+            for file_id, destroyed_generation in snapshots['destroyed'].items()
+            if destroyed_generation > generation
+        ]
+        backup_headers = {
+            SINCE_HEADER: snapshot_name,
+            UNTIL_HEADER: self.__last_snapshot(snapshots),
+            POSITION_HEADER: str(snapshot['position']),
+        }
+
+        self.__write_archive(archive, ids, destroyed, backup_headers)
+
+    @staticmethod
+    def __last_snapshot(snapshots: dict):
+        """
+        Return the name of the last snapshot taken.
+
+        :param snapshots: Dict of the snapshot storage
+        :return: Snapshot name
+        """
+
+        return max(snapshots['snapshots'], key=lambda name: snapshots['snapshots'][name]['generation'])
+
+    def __write_archive(self, archive, ids: dict, destroyed: list, backup_headers: dict):
+        """
+        Write a tar archive to the provided binary stream containing a member
+        with the backup headers, a destroy member for every destroyed id and
+        every provided file.
+
+        The files are read in the order of their storage position so the
+        storage file is only read forward. The members tar keeps track of are
+        cleared after every member so the headers are not kept in memory.
+
+        :param archive: Writable binary stream
+        :param ids: Dict of file ids and their stats
+        :param destroyed: List of destroyed file ids
+        :param backup_headers: Headers of the backup member
+        """
+
+        entries = sorted(ids.items(), key=lambda item: item[1]['position'])
+
+        with open(self.storage_path, 'rb') as r_file:
+            with tarfile.open(fileobj=archive, mode='w|', format=tarfile.PAX_FORMAT) as tar:
+                backup_info = tarfile.TarInfo(BACKUP_MEMBER)
+                backup_info.type = tarfile.DIRTYPE
+                backup_info.pax_headers = backup_headers
+                tar.addfile(backup_info)
+                tar.members = []
+
+                for file_id in destroyed:
+                    tar_info = tarfile.TarInfo(file_id)
+                    tar_info.pax_headers = {ACTION_HEADER: DESTROY_ACTION}
+                    tar.addfile(tar_info)
+                    tar.members = []
+
+                for file_id, file_stats in entries:
+                    tar_info = tarfile.TarInfo(file_id)
+                    tar_info.size = file_stats['size']
+                    tar_info.pax_headers = {NAME_HEADER: file_stats['name']}
+
+                    r_file.seek(file_stats['position'], os.SEEK_SET)
+                    tar.addfile(tar_info, r_file)
+                    tar.members = []
+
+    @staticmethod
+    def __read_archive(tar: tarfile.TarFile, tar_info: tarfile.TarInfo):
+        """
+        Yield a file record for every regular file inside the archive
+        as the archive is being read, starting from the provided member.
+
+        The members tar keeps track of are cleared once a member has been
+        used so the headers are not kept in memory.
+
+        :param tar: Tar archive opened in stream mode
+        :param tar_info: First member of the archive
+        :return: Generator of file records
+        """
+
+        while tar_info is not None:
+            if tar_info.isfile():
+                if tar_info.pax_headers.get(ACTION_HEADER) == DESTROY_ACTION:
+                    yield {
+                        'id': tar_info.name,
+                        'destroyed': True,
+                    }
+                else:
+                    yield {
+                        'id': tar_info.name,
+                        'name': tar_info.pax_headers.get(NAME_HEADER, os.path.basename(tar_info.name)),
+                        'size': tar_info.size,
+                        'stream': tar.extractfile(tar_info),
+                    }
+
+            tar.members = []
+            tar_info = tar.next()
+
 
 class FileNotFoundException(Exception):
     """
@@ -291,3 +939,63 @@ class DirectoryNotSpecifiedException(Exception):
 
     def __str__(self):
         return f'File {self.file_path} is not a directory'
+
+
+class SnapshotAlreadyExistsException(Exception):
+    """
+    Exception class that raises an exception when the program tries to
+    take a snapshot with a name that is already taken.
+    """
+
+    def __init__(self, snapshot_name: str):
+        """
+        Initialize the exception class by storing the snapshot name that
+        already exists in the snapshot storage.
+
+        :param snapshot_name: Snapshot name
+        """
+
+        self.snapshot_name = snapshot_name
+
+    def __str__(self):
+        return f'Snapshot "{self.snapshot_name}" already exists'
+
+
+class SnapshotNotFoundException(Exception):
+    """
+    Exception class that raises an exception when the snapshot provided
+    does not exist inside the snapshot storage.
+    """
+
+    def __init__(self, snapshot_name: str):
+        """
+        Initialize the exception class by storing the snapshot name that
+        was not found.
+
+        :param snapshot_name: Snapshot name
+        """
+
+        self.snapshot_name = snapshot_name
+
+    def __str__(self):
+        return f'Snapshot {self.snapshot_name} not found'
+
+
+class BackupOutOfOrderException(Exception):
+    """
+    Exception class that raises an exception when the backup provided
+    does not follow the last archive restored into the storage.
+    """
+
+    def __init__(self, snapshot_name: str):
+        """
+        Initialize the exception class by storing the snapshot name the
+        backup is based on.
+
+        :param snapshot_name: Snapshot name
+        """
+
+        self.snapshot_name = snapshot_name
+
+    def __str__(self):
+        return f'Backup since snapshot {self.snapshot_name} does not follow the last restored archive'
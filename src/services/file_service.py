@@ -20,6 +20,10 @@ class IFileService(ABC):
     def store_files(self, files: list):
         pass
 
+    @abstractmethod
+    def sync_files(self, files: list):
+        pass
+
     @abstractmethod
     def load_file(self, file_id: str):
         pass
@@ -36,6 +40,26 @@ class IFileService(ABC):
     def destroy_files(self, ids: str):
         pass
 
+    @abstractmethod
+    def export_files(self, archive):
+        pass
+
+    @abstractmethod
+    def import_files(self, archive):
+        pass
+
+    @abstractmethod
+    def create_snapshot(self, snapshot_name: str):
+        pass
+
+    @abstractmethod
+    def backup_files(self, archive, snapshot_name: str):
+        pass
+
+    @abstractmethod
+    def restore_files(self, archives: list):
+        pass
+
 
 class FileService(IFileService):
     """
@@ -75,8 +99,18 @@ class FileService(IFileService):
         :param files: List of dicts containing a file path and a file id
         """
 
-        for file in files:
-            self.file_repository.store_file(file['path'], file['id'])
+        self.file_repository.store_files(files)
+
+    def sync_files(self, files: list):
+        """
+        Store multiple files inside the storage skipping the unchanged
+        ones and replacing the changed ones by providing a list of
+        dictionary objects containing a file path and a file id.
+
+        :param files: List of dicts containing a file path and a file id
+        """
+
+        self.file_repository.sync_files(files)
 
     def load_file(self, file_id: str):
         """
@@ -119,3 +153,54 @@ class FileService(IFileService):
 
         for file_id in ids:
             self.file_repository.destroy_file(file_id)
+
+    def export_files(self, archive):
+        """
+        Export every file inside the storage into a tar archive written
+        to the provided binary stream.
+
+        :param archive: Writable binary stream
+        """
+
+        self.file_repository.export_files(archive)
+
+    def import_files(self, archive):
+        """
+        Import every file inside a tar archive read from the provided
+        binary stream into the storage.
+
+        :param archive: Readable binary stream
+        """
+
+        self.file_repository.import_files(archive)
+
+    def create_snapshot(self, snapshot_name: str):
+        """
+        Take a snapshot of the storage that later backups can be
+        based on by providing a snapshot name.
+
+        :param snapshot_name: Snapshot name
+        """
+
+        self.file_repository.create_snapshot(snapshot_name)
+
+    def backup_files(self, archive, snapshot_name: str):
+        """
+        Back up the changes made since a snapshot into a tar archive
+        written to the provided binary stream.
+
+        :param archive: Writable binary stream
+        :param snapshot_name: Snapshot name
+        """
+
+        self.file_repository.backup_files(archive, snapshot_name)
+
+    def restore_files(self, archives: list):
+        """
+        Restore multiple backups into the storage by providing a list of
+        binary streams in the order the backups were taken.
+
+        :param archives: List of readable binary streams
+        """
+
+        self.file_repository.restore_files(archives)
@@ -0,0 +1,30 @@
+from src.services.file_service import IFileService
+
+
+class BackupFiles(object):
+    """
+    Use case scenario class for backing up the storage.
+
+    Contains methods for backing up the changes made
+    since a snapshot into a tar archive.
+    """
+
+    def __init__(self, file_service: IFileService):
+        """
+        Initialize the use case by obtaining an instance of file service
+        using the dependency container.
+
+        :param file_service: File service
+        """
+
+        self.file_service = file_service
+
+    def backup_files(self, archive, snapshot_name: str):
+        """
+        Back up the changes made since a snapshot into a tar archive.
+
+        :param archive: Writable binary stream
+        :param snapshot_name: Snapshot name
+        """
+
+        self.file_service.backup_files(archive, snapshot_name)
@@ -0,0 +1,29 @@
+from src.services.file_service import IFileService
+
+
+class CreateSnapshot(object):
+    """
+    Use case scenario class for taking snapshots of the storage.
+
+    Contains methods for taking a named snapshot that
+    backups can be based on.
+    """
+
+    def __init__(self, file_service: IFileService):
+        """
+        Initialize the use case by obtaining an instance of file service
+        using the dependency container.
+
+        :param file_service: File service
+        """
+
+        self.file_service = file_service
+
+    def create_snapshot(self, snapshot_name: str):
+        """
+        Take a snapshot of the storage.
+
+        :param snapshot_name: Snapshot name
+        """
+
+        self.file_service.create_snapshot(snapshot_name)
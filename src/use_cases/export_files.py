@@ -0,0 +1,29 @@
+from src.services.file_service import IFileService
+
+
+class ExportFiles(object):
+    """
+    Use case scenario class for exporting the storage.
+
+    Contains methods for exporting all of the stored files
+    into a tar archive.
+    """
+
+    def __init__(self, file_service: IFileService):
+        """
+        Initialize the use case by obtaining an instance of file service
+        using the dependency container.
+
+        :param file_service: File service
+        """
+
+        self.file_service = file_service
+
+    def export_files(self, archive):
+        """
+        Export all of the stored files into a tar archive.
+
+        :param archive: Writable binary stream
+        """
+
+        self.file_service.export_files(archive)
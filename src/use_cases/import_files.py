@@ -0,0 +1,29 @@
+from src.services.file_service import IFileService
+
+
+class ImportFiles(object):
+    """
+    Use case scenario class for importing into the storage.
+
+    Contains methods for importing all of the files
+    inside a tar archive.
+    """
+
+    def __init__(self, file_service: IFileService):
+        """
+        Initialize the use case by obtaining an instance of file service
+        using the dependency container.
+
+        :param file_service: File service
+        """
+
+        self.file_service = file_service
+
+    def import_files(self, archive):
+        """
+        Import all of the files inside a tar archive.
+
+        :param archive: Readable binary stream
+        """
+
+        self.file_service.import_files(archive)
@@ -0,0 +1,29 @@
+from src.services.file_service import IFileService
+
+
+class RestoreFiles(object):
+    """
+    Use case scenario class for restoring backups into the storage.
+
+    Contains methods for restoring one or multiple
+    backup archives in order.
+    """
+
+    def __init__(self, file_service: IFileService):
+        """
+        Initialize the use case by obtaining an instance of file service
+        using the dependency container.
+
+        :param file_service: File service
+        """
+
+        self.file_service = file_service
+
+    def restore_files(self, archives: list):
+        """
+        Restore multiple backup archives in the order they were taken.
+
+        :param archives: List of readable binary streams
+        """
+
+        self.file_service.restore_files(archives)
@@ -37,3 +37,13 @@ class StoreFile(object):
         """
 
         self.file_service.store_files(files)
+
+    def sync_files(self, files: list):
+        """
+        Store multiple files inside the storage skipping the ones
+        that did not change since they were last stored.
+
+        :param files: List of dicts containing a file path and a file id
+        """
+
+        self.file_service.sync_files(files)